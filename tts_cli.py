@@ -6,11 +6,117 @@ Interactive CLI tool for converting text, PDFs, and EPUBs to speech.
 Supports multiple TTS models, PDF extractors, and output formats.
 """
 
+import io
 import os
+import re
 import sys
+import glob
+import stat
 import json
-from pathlib import Path
-from typing import Optional, Tuple
+import mmap
+import copy
+import argparse
+import hashlib
+import functools
+from array import array
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Per-user state directory (dependency stamps, caches)
+STATE_DIR = os.path.join(os.path.expanduser("~"), ".ttscli")
+
+# Finished conversions, reused when the same input and settings come again
+OUTPUT_CACHE_DIR = os.path.join(STATE_DIR, "cache")
+
+# Text inputs above this size get a warning (~1 MB)
+LARGE_TEXT_CHARS = 1_000_000
+
+# Write buffer for stdout when redirected to a file or pipe
+STDOUT_BUFFER_SIZE = 64 * 1024
+
+# Config files at least this large are parsed from a memory map
+_MMAP_MIN_BYTES = 64 * 1024
+
+# Speech speed range offered by the backends
+MIN_SPEED = 0.5
+MAX_SPEED = 2.0
+
+# One comma-separated page-selection part: "7" or "5-9"
+_MAX_PAGE = 100_000
+_PAGE_RE = re.compile(r"(?:^|,)\s*(\d+)\s*(?:-\s*(\d+))?\s*(?=,|$)")
+
+# Menu separators
+_SEP70_EQ = "=" * 70
+_SEP70_DASH = "-" * 70
+_SEP50_DASH = "-" * 50
+
+# Menu option tables: (menu key, config value, label)
+CONVERSION_TYPES = (
+    ("1", "pdf", "PDF to audio"),
+    ("2", "epub", "EPUB to audio (per-chapter ZIP)"),
+    ("3", "string", "Text string to audio"),
+)
+TTS_MODELS = (
+    ("1", "kokoro_1.0", "Kokoro v1.0 (54 voices, 8 languages) [Recommended]"),
+    ("2", "kokoro_0.9", "Kokoro v0.9 (10 voices, English, stable)"),
+    ("3", "qwen3_custom_voice", "Qwen3-TTS Custom Voice (10 languages, pre-configured)"),
+    ("4", "qwen3_voice_design", "Qwen3-TTS Voice Design (natural language descriptions)"),
+    ("5", "qwen3_base", "Qwen3-TTS Base (3-second voice cloning)"),
+    ("6", "maya1", "Maya1 (20+ emotions, requires GPU)"),
+    ("7", "silero_v5", "Silero v5 (Russian language)"),
+)
+PDF_EXTRACTORS = (
+    ("1", "unstructured", "Unstructured (advanced layout analysis) [Recommended]"),
+    ("2", "pymupdf", "PyMuPDF (fast, for clean PDFs)"),
+    ("3", "vision", "Apple Vision (OCR for scanned PDFs, macOS only)"),
+    ("4", "nougat", "Nougat (academic papers with equations)"),
+)
+OUTPUT_FORMATS = (
+    ("1", "mp3", "MP3 (compressed, smaller file size)"),
+    ("2", "wav", "WAV (uncompressed, higher quality)"),
+)
+DEVICES = (
+    ("1", "auto", "Auto (recommended)"),
+    ("2", "cuda", "CUDA (GPU)"),
+    ("3", "cpu", "CPU"),
+    ("4", "mps", "MPS (Apple Silicon)"),
+)
+
+# Menu key -> (config value, short label without the parenthesized details)
+_CONVERSION_TYPE_NAMES = {"pdf": "PDF", "epub": "EPUB", "string": "Text String"}
+_TYPE_BY_KEY = {key: (value, _CONVERSION_TYPE_NAMES[value]) for key, value, _ in CONVERSION_TYPES}
+_TTS_BY_KEY = {key: (value, label.split(' (')[0]) for key, value, label in TTS_MODELS}
+_EXTRACTOR_BY_KEY = {key: (value, label.split(' (')[0]) for key, value, label in PDF_EXTRACTORS}
+_FORMAT_BY_KEY = {key: (value, label.split(' (')[0]) for key, value, label in OUTPUT_FORMATS}
+_DEVICE_BY_KEY = {key: (value, label.split(' (')[0]) for key, value, label in DEVICES}
+
+# Short names for the status line and configuration view (read-only)
+_MODEL_DISPLAY_NAMES = MappingProxyType({
+    "kokoro_1.0": "Kokoro v1.0",
+    "kokoro_0.9": "Kokoro v0.9",
+    "qwen3_custom_voice": "Qwen3 Custom",
+    "qwen3_voice_design": "Qwen3 Design",
+    "qwen3_base": "Qwen3 Base",
+    "maya1": "Maya1",
+    "silero_v5": "Silero v5",
+})
+_EXTRACTOR_DISPLAY_NAMES = MappingProxyType({
+    "unstructured": "Unstructured",
+    "pymupdf": "PyMuPDF",
+    "vision": "Vision",
+    "nougat": "Nougat",
+})
+
+# Loaded TTS backends by (tts_model, device), reused across conversions
+_INIT_CACHE = {}
+
+# Stamp paths already confirmed this session, so repeat runs skip the stat
+_DEPS_VERIFIED = set()
 
 
 # ANSI color codes for terminal formatting
@@ -24,9 +130,66 @@ class Colors:
     END = '\033[0m'
 
 
+_UTF = (getattr(sys.stdout, "encoding", None) or "").lower().startswith("utf")
+
+
+class Symbols:
+    """Status glyphs, with ASCII stand-ins for pipes and non-UTF-8 consoles."""
+    OK = '✓' if _UTF else '[OK]'
+    WARN = '⚠️' if _UTF else '[!]'
+    FAIL = '✗' if _UTF else '[X]'
+    MIC = '🎤' if _UTF else '>>'
+    ROCKET = '🚀' if _UTF else '>>'
+    PACKAGE = '📦' if _UTF else '>>'
+    TIP = '💡' if _UTF else '*'
+    WAVE = '👋' if _UTF else '*'
+
+
+# Status message prefixes, precomputed once (see _disable_colors)
+_OK = f"{Colors.GREEN}{Symbols.OK} "
+_WARN = f"{Colors.YELLOW}{Symbols.WARN}  "
+_FAIL = f"{Colors.YELLOW}{Symbols.FAIL} "
+_END = Colors.END
+
+_ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+
+def ok(msg: str) -> str:
+    """Format a success message."""
+    return f"{_OK}{msg}{_END}"
+
+
+def warn(msg: str) -> str:
+    """Format a warning message."""
+    return f"{_WARN}{msg}{_END}"
+
+
+def fail(msg: str) -> str:
+    """Format an error message."""
+    return f"{_FAIL}{msg}{_END}"
+
+
+# Marks keys absent from a loaded configuration
+_MISSING = object()
+
+
 class TTSConfig:
     """Configuration for TTS CLI session."""
 
+    __slots__ = (
+        "conversion_type", "tts_model", "pdf_extractor", "output_format",
+        "device", "output_dir", "pdf_path", "pdf_pages", "epub_path",
+        "text_input", "voice", "speed", "batch_size", "use_cache",
+        "_pdf_stat", "_epub_stat", "_text_preview", "_output_dir_created",
+        "_cli_overrides",
+    )
+
+    # Slots persisted by save_to_file (inputs and cached state are per session)
+    _CONFIG_KEYS = (
+        "conversion_type", "tts_model", "pdf_extractor", "output_format",
+        "device", "output_dir", "voice", "speed", "batch_size",
+    )
+
     def __init__(self):
         self.conversion_type = "pdf"
         self.tts_model = "kokoro_1.0"
@@ -40,246 +203,366 @@ class TTSConfig:
         self.text_input = None
         self.voice = None
         self.speed = 1.0
+        self.batch_size = 8
+        self.use_cache = True
+        # Cached os.stat results for the selected input files (None = missing)
+        self._pdf_stat = None
+        self._epub_stat = None
+        # Shortened text shown in the configuration view
+        self._text_preview = None
+        # Output directory already created by a conversion (None = not yet)
+        self._output_dir_created = None
+        # Settings given on the command line: key -> (saved value, CLI value)
+        self._cli_overrides = {}
+
+    def set_pdf_path(self, path):
+        """Set the PDF path and cache its stat result."""
+        self.pdf_path = path
+        self._pdf_stat = _stat_or_none(path)
+
+    def set_epub_path(self, path):
+        """Set the EPUB path and cache its stat result."""
+        self.epub_path = path
+        self._epub_stat = _stat_or_none(path)
+
+    def set_override(self, key, value):
+        """Set a saved setting for this session only (from a command-line flag)."""
+        saved = self._cli_overrides.get(key, (getattr(self, key), None))[0]
+        self._cli_overrides[key] = (saved, value)
+        setattr(self, key, value)
+
+    def refresh_input_stat(self):
+        """Re-stat the selected input file, which may have moved since it was set."""
+        if self.conversion_type == "pdf" and self.pdf_path:
+            self._pdf_stat = _stat_or_none(self.pdf_path)
+        elif self.conversion_type == "epub" and self.epub_path:
+            self._epub_stat = _stat_or_none(self.epub_path)
+
+    def set_text_input(self, text):
+        """Set the text to convert and cache its preview."""
+        self.text_input = text
+        self._text_preview = text[:50] + "..." if text and len(text) > 50 else text
 
     def to_dict(self):
         """Convert config to dictionary for saving."""
-        return {
-            'conversion_type': self.conversion_type,
-            'tts_model': self.tts_model,
-            'pdf_extractor': self.pdf_extractor,
-            'output_format': self.output_format,
-            'device': self.device,
-            'output_dir': self.output_dir,
-            'voice': self.voice,
-            'speed': self.speed
-        }
+        return {key: getattr(self, key) for key in self._CONFIG_KEYS}
 
     def from_dict(self, data):
-        """Load config from dictionary."""
-        for key, value in data.items():
-            if hasattr(self, key):
+        """Load config from dictionary (unknown keys are ignored)."""
+        for key in self._CONFIG_KEYS:
+            value = data.get(key, _MISSING)
+            if value is not _MISSING:
                 setattr(self, key, value)
 
-    def save_to_file(self, filename=".tts_cli_config.json"):
-        """Save configuration to file."""
-        config_path = Path.home() / filename
-        with open(config_path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+    def save_to_file(self, filename=".tts_cli_config.json", persist_overrides=True):
+        """Save configuration to file (atomically, via a temp file).
+
+        With persist_overrides=False, settings still at the value given on the
+        command line keep their previously saved value.
+        """
+        config_path = os.path.join(os.path.expanduser("~"), filename)
+        tmp_path = config_path + ".tmp"
+        data = self.to_dict()
+        if not persist_overrides:
+            for key, (saved, value) in self._cli_overrides.items():
+                if data[key] == value:
+                    data[key] = saved
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(data))
+                # Make the data durable before the rename publishes it
+                os.fsync(f.fileno())
+            os.replace(tmp_path, config_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        if persist_overrides:
+            self._cli_overrides.clear()
         return config_path
 
     def load_from_file(self, filename=".tts_cli_config.json"):
-        """Load configuration from file."""
-        config_path = Path.home() / filename
-        if config_path.exists():
-            with open(config_path, 'r') as f:
-                data = json.load(f)
-                self.from_dict(data)
-            return True
-        return False
+        """Load configuration from file.
+
+        Returns False (keeping current values) if the file is missing or corrupt.
+        """
+        config_path = os.path.join(os.path.expanduser("~"), filename)
+        try:
+            with open(config_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        data = _json_loads(mm)
+                else:
+                    data = _json_loads(f.read())
+        except (OSError, ValueError):
+            return False
+        if not isinstance(data, dict):
+            return False
+        self.from_dict(data)
+        self._cli_overrides.clear()
+        return True
+
+    def reset(self):
+        """Reset saved settings to defaults (input selection is kept)."""
+        self.from_dict(TTSConfig().to_dict())
+        self._cli_overrides.clear()
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _json_loads(raw):
+    """Parse JSON from bytes or a memory map, using orjson when available."""
+    if orjson is not None:
+        with memoryview(raw) as view:
+            return orjson.loads(view)
+    return json.loads(bytes(raw))
+
+
+def _stat_or_none(path):
+    """Stat a path once, returning None if it does not exist."""
+    try:
+        return os.stat(path)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_regular_file(st) -> bool:
+    """Check a cached stat result for an existing regular file."""
+    return st is not None and stat.S_ISREG(st.st_mode)
 
 
 def get_model_display_name(model_key):
     """Get display name for TTS model."""
-    names = {
-        "kokoro_1.0": "Kokoro v1.0",
-        "kokoro_0.9": "Kokoro v0.9",
-        "qwen3_custom_voice": "Qwen3 Custom",
-        "qwen3_voice_design": "Qwen3 Design",
-        "qwen3_base": "Qwen3 Base",
-        "maya1": "Maya1",
-        "silero_v5": "Silero v5",
-    }
-    return names.get(model_key, model_key)
+    return _MODEL_DISPLAY_NAMES.get(model_key, model_key)
 
 
 def get_extractor_display_name(extractor_key):
     """Get display name for PDF extractor."""
-    names = {
-        "unstructured": "Unstructured",
-        "pymupdf": "PyMuPDF",
-        "vision": "Vision",
-        "nougat": "Nougat",
-    }
-    return names.get(extractor_key, extractor_key)
+    return _EXTRACTOR_DISPLAY_NAMES.get(extractor_key, extractor_key)
+
+
+def _invalid_choice(config: TTSConfig):
+    """Report an unknown menu choice."""
+    print(warn("Invalid choice. Please try again."))
+
+
+def _autosave(config: TTSConfig):
+    """Persist configuration after a change (best effort).
+
+    One-off command-line flags are not saved as the new defaults.
+    """
+    try:
+        config.save_to_file(persist_overrides=False)
+    except OSError:
+        pass
+
+
+# Static menu text, composed once at import
+_BANNER = "\n".join([
+    "",
+    _SEP70_EQ,
+    "  TTS CLI - Text-to-Speech Converter",
+    "  Convert PDFs, EPUBs, and Text to Natural Speech",
+    _SEP70_EQ,
+    "",
+])
+_MAIN_MENU = "\n".join([
+    "",
+    _SEP70_DASH,
+    "MAIN MENU",
+    _SEP70_DASH,
+    "1. Configure conversion settings",
+    "2. Select input file/text",
+    "3. Run conversion",
+    "4. View full configuration",
+    "5. Advanced settings (voice, speed, device, batch size)",
+    f"6. {Colors.BOLD}Save current configuration{Colors.END}",
+    f"7. {Colors.BOLD}Load saved configuration{Colors.END}",
+    "8. Storage management (view & clean model caches)",
+    "9. Unload cached TTS model (free memory)",
+    "0. Exit",
+    _SEP70_DASH,
+])
+_CONFIG_MENU_TMPL = f"""
+{_SEP70_DASH}
+CONFIGURATION MENU
+{_SEP70_DASH}
+1. Set conversion type{{type_indicator}}
+2. Select TTS model{{model_indicator}}
+3. Select PDF extractor{{extractor_indicator}}
+4. Set output format{{format_indicator}}
+5. Set output directory {Colors.DIM}[{{output_dir}}]{Colors.END}
+6. Reset to defaults
+0. Back to main menu
+{_SEP70_DASH}"""
+_ADVANCED_MENU_TMPL = f"""
+{_SEP70_DASH}
+ADVANCED SETTINGS
+{_SEP70_DASH}
+1. Set voice/speaker {Colors.DIM}[{{voice}}]{Colors.END}
+2. Set speech speed {Colors.DIM}[{{speed}}]{Colors.END}
+3. Set device {Colors.DIM}[{{device}}]{Colors.END}
+4. Set synthesis batch size {Colors.DIM}[{{batch_size}}]{Colors.END}
+0. Back to main menu
+{_SEP70_DASH}"""
+_VIEW_CONFIG_TMPL = f"""
+{_SEP70_EQ}
+CURRENT CONFIGURATION
+{_SEP70_EQ}
+Conversion Type:  {Colors.BOLD}{{conversion_type}}{Colors.END}
+TTS Model:        {Colors.BOLD}{{model}}{Colors.END}
+PDF Extractor:    {Colors.BOLD}{{extractor}}{Colors.END}
+Output Format:    {Colors.BOLD}{{output_format}}{Colors.END}
+Output Directory: {{output_dir}}
+Device:           {{device}}
+Voice:            {{voice}}
+Speed:            {{speed}}
+Batch Size:       {{batch_size}}
+{{input_lines}}{_SEP70_EQ}"""
+
+
+def _emit(lines):
+    """Write lines to stdout with a single write call and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def print_banner():
     """Print CLI banner."""
-    print("\n" + "="*70)
-    print("  TTS CLI - Text-to-Speech Converter")
-    print("  Convert PDFs, EPUBs, and Text to Natural Speech")
-    print("="*70 + "\n")
+    _emit([_BANNER])
 
 
-def print_current_config_inline(config: TTSConfig):
-    """Print current configuration inline (compact view)."""
+def _config_inline(config: TTSConfig) -> str:
+    """Format current configuration inline (compact view)."""
     type_display = config.conversion_type.upper()
     model_display = get_model_display_name(config.tts_model)
     extractor_display = get_extractor_display_name(config.pdf_extractor)
     format_display = config.output_format.upper()
 
-    print(f"{Colors.DIM}Current: {type_display} | {model_display} | "
-          f"{extractor_display} | {format_display}{Colors.END}")
+    return (f"{Colors.DIM}Current: {type_display} | {model_display} | "
+            f"{extractor_display} | {format_display}{Colors.END}")
 
 
 def print_menu(config: TTSConfig):
     """Print main menu with current config."""
-    print("\n" + "-"*70)
-    print("MAIN MENU")
-    print("-"*70)
-    print(f"1. Configure conversion settings")
-    print(f"2. Select input file/text")
-    print(f"3. Run conversion")
-    print(f"4. View full configuration")
-    print(f"5. Advanced settings (voice, speed, device)")
-    print(f"6. {Colors.BOLD}Save current configuration{Colors.END}")
-    print(f"7. {Colors.BOLD}Load saved configuration{Colors.END}")
-    print(f"8. Storage management (view & clean model caches)")
-    print(f"0. Exit")
-    print("-"*70)
-    print_current_config_inline(config)
+    _emit([_MAIN_MENU, _config_inline(config)])
+
+
+@functools.lru_cache(maxsize=64)
+def _bold_current(value: str) -> str:
+    """Format a bold ' [value]' marker for the current menu selection."""
+    return f" {Colors.BOLD}[{value}]{Colors.END}"
 
 
 def print_config_menu(config: TTSConfig):
     """Print configuration menu."""
-    print("\n" + "-"*70)
-    print("CONFIGURATION MENU")
-    print("-"*70)
-
     # Highlight current selections
-    type_indicator = f" {Colors.BOLD}[{config.conversion_type.upper()}]{Colors.END}"
-    model_indicator = f" {Colors.BOLD}[{get_model_display_name(config.tts_model)}]{Colors.END}"
-    extractor_indicator = f" {Colors.BOLD}[{get_extractor_display_name(config.pdf_extractor)}]{Colors.END}"
-    format_indicator = f" {Colors.BOLD}[{config.output_format.upper()}]{Colors.END}"
-
-    print(f"1. Set conversion type{type_indicator}")
-    print(f"2. Select TTS model{model_indicator}")
-    print(f"3. Select PDF extractor{extractor_indicator}")
-    print(f"4. Set output format{format_indicator}")
-    print(f"5. Set output directory {Colors.DIM}[{config.output_dir}]{Colors.END}")
-    print(f"0. Back to main menu")
-    print("-"*70)
+    _emit([_CONFIG_MENU_TMPL.format_map({
+        "type_indicator": _bold_current(config.conversion_type.upper()),
+        "model_indicator": _bold_current(get_model_display_name(config.tts_model)),
+        "extractor_indicator": _bold_current(get_extractor_display_name(config.pdf_extractor)),
+        "format_indicator": _bold_current(config.output_format.upper()),
+        "output_dir": config.output_dir,
+    })])
 
 
 def select_conversion_type(config: TTSConfig):
     """Select conversion type."""
-    print("\n" + "-"*50)
-    print("SELECT CONVERSION TYPE")
-    print("-"*50)
-
     current = config.conversion_type
-    print(f"1. PDF to audio{' ' + Colors.BOLD + '[CURRENT]' + Colors.END if current == 'pdf' else ''}")
-    print(f"2. EPUB to audio (per-chapter ZIP){' ' + Colors.BOLD + '[CURRENT]' + Colors.END if current == 'epub' else ''}")
-    print(f"3. Text string to audio{' ' + Colors.BOLD + '[CURRENT]' + Colors.END if current == 'string' else ''}")
-    print("0. Cancel")
-
-    choice = input("\nEnter choice [1-3]: ").strip()
-
-    if choice == "1":
-        config.conversion_type = "pdf"
-        print(f"{Colors.GREEN}✓ Conversion type set to: PDF{Colors.END}")
-    elif choice == "2":
-        config.conversion_type = "epub"
-        print(f"{Colors.GREEN}✓ Conversion type set to: EPUB{Colors.END}")
-    elif choice == "3":
-        config.conversion_type = "string"
-        print(f"{Colors.GREEN}✓ Conversion type set to: Text String{Colors.END}")
+    lines = ["", _SEP50_DASH, "SELECT CONVERSION TYPE", _SEP50_DASH]
+    for num, key, desc in CONVERSION_TYPES:
+        indicator = _bold_current("CURRENT") if current == key else ""
+        lines.append(f"{num}. {desc}{indicator}")
+    lines.append("0. Cancel")
+    _emit(lines)
+
+    choice = input(f"\nEnter choice [1-{len(CONVERSION_TYPES)}]: ").strip()
+
+    if choice in _TYPE_BY_KEY:
+        conversion_type, name = _TYPE_BY_KEY[choice]
+        config.conversion_type = conversion_type
+        _autosave(config)
+        print(ok(f"Conversion type set to: {name}"))
     elif choice == "0":
         print("Cancelled")
     else:
-        print(f"{Colors.YELLOW}⚠️  Invalid choice{Colors.END}")
+        print(warn("Invalid choice"))
 
 
 def select_tts_model(config: TTSConfig):
     """Select TTS model."""
-    print("\n" + "-"*50)
-    print("SELECT TTS MODEL")
-    print("-"*50)
-
     current = config.tts_model
-    models = [
-        ("1", "kokoro_1.0", "Kokoro v1.0 (54 voices, 8 languages) [Recommended]"),
-        ("2", "kokoro_0.9", "Kokoro v0.9 (10 voices, English, stable)"),
-        ("3", "qwen3_custom_voice", "Qwen3-TTS Custom Voice (10 languages, pre-configured)"),
-        ("4", "qwen3_voice_design", "Qwen3-TTS Voice Design (natural language descriptions)"),
-        ("5", "qwen3_base", "Qwen3-TTS Base (3-second voice cloning)"),
-        ("6", "maya1", "Maya1 (20+ emotions, requires GPU)"),
-        ("7", "silero_v5", "Silero v5 (Russian language)"),
-    ]
-
-    for num, key, desc in models:
-        indicator = f" {Colors.BOLD}[CURRENT]{Colors.END}" if current == key else ""
-        print(f"{num}. {desc}{indicator}")
-    print("0. Cancel")
-
-    choice = input("\nEnter choice [1-7]: ").strip()
-
-    model_map = {m[0]: (m[1], m[2].split(' (')[0]) for m in models}
-
-    if choice in model_map:
-        config.tts_model = model_map[choice][0]
-        print(f"{Colors.GREEN}✓ TTS model set to: {model_map[choice][1]}{Colors.END}")
+    lines = ["", _SEP50_DASH, "SELECT TTS MODEL", _SEP50_DASH]
+    for num, key, desc in TTS_MODELS:
+        indicator = _bold_current("CURRENT") if current == key else ""
+        lines.append(f"{num}. {desc}{indicator}")
+    lines.append("0. Cancel")
+    _emit(lines)
+
+    choice = input(f"\nEnter choice [1-{len(TTS_MODELS)}]: ").strip()
+
+    if choice in _TTS_BY_KEY:
+        model, label = _TTS_BY_KEY[choice]
+        config.tts_model = model
+        _autosave(config)
+        print(ok(f"TTS model set to: {label}"))
     elif choice == "0":
         print("Cancelled")
     else:
-        print(f"{Colors.YELLOW}⚠️  Invalid choice{Colors.END}")
+        print(warn("Invalid choice"))
 
 
 def select_pdf_extractor(config: TTSConfig):
     """Select PDF extractor."""
-    print("\n" + "-"*50)
-    print("SELECT PDF EXTRACTOR")
-    print("-"*50)
-
     current = config.pdf_extractor
-    extractors = [
-        ("1", "unstructured", "Unstructured (advanced layout analysis) [Recommended]"),
-        ("2", "pymupdf", "PyMuPDF (fast, for clean PDFs)"),
-        ("3", "vision", "Apple Vision (OCR for scanned PDFs, macOS only)"),
-        ("4", "nougat", "Nougat (academic papers with equations)"),
-    ]
-
-    for num, key, desc in extractors:
-        indicator = f" {Colors.BOLD}[CURRENT]{Colors.END}" if current == key else ""
-        print(f"{num}. {desc}{indicator}")
-    print("0. Cancel")
-
-    choice = input("\nEnter choice [1-4]: ").strip()
-
-    extractor_map = {e[0]: (e[1], e[2].split(' (')[0]) for e in extractors}
-
-    if choice in extractor_map:
-        config.pdf_extractor = extractor_map[choice][0]
-        print(f"{Colors.GREEN}✓ PDF extractor set to: {extractor_map[choice][1]}{Colors.END}")
+    lines = ["", _SEP50_DASH, "SELECT PDF EXTRACTOR", _SEP50_DASH]
+    for num, key, desc in PDF_EXTRACTORS:
+        indicator = _bold_current("CURRENT") if current == key else ""
+        lines.append(f"{num}. {desc}{indicator}")
+    lines.append("0. Cancel")
+    _emit(lines)
+
+    choice = input(f"\nEnter choice [1-{len(PDF_EXTRACTORS)}]: ").strip()
+
+    if choice in _EXTRACTOR_BY_KEY:
+        extractor, label = _EXTRACTOR_BY_KEY[choice]
+        config.pdf_extractor = extractor
+        _autosave(config)
+        print(ok(f"PDF extractor set to: {label}"))
     elif choice == "0":
         print("Cancelled")
     else:
-        print(f"{Colors.YELLOW}⚠️  Invalid choice{Colors.END}")
+        print(warn("Invalid choice"))
 
 
 def select_output_format(config: TTSConfig):
     """Select output format."""
-    print("\n" + "-"*50)
-    print("SELECT OUTPUT FORMAT")
-    print("-"*50)
-
     current = config.output_format
-    print(f"1. MP3 (compressed, smaller file size){' ' + Colors.BOLD + '[CURRENT]' + Colors.END if current == 'mp3' else ''}")
-    print(f"2. WAV (uncompressed, higher quality){' ' + Colors.BOLD + '[CURRENT]' + Colors.END if current == 'wav' else ''}")
-    print("0. Cancel")
-
-    choice = input("\nEnter choice [1-2]: ").strip()
-
-    if choice == "1":
-        config.output_format = "mp3"
-        print(f"{Colors.GREEN}✓ Output format set to: MP3{Colors.END}")
-    elif choice == "2":
-        config.output_format = "wav"
-        print(f"{Colors.GREEN}✓ Output format set to: WAV{Colors.END}")
+    lines = ["", _SEP50_DASH, "SELECT OUTPUT FORMAT", _SEP50_DASH]
+    for num, key, desc in OUTPUT_FORMATS:
+        indicator = _bold_current("CURRENT") if current == key else ""
+        lines.append(f"{num}. {desc}{indicator}")
+    lines.append("0. Cancel")
+    _emit(lines)
+
+    choice = input(f"\nEnter choice [1-{len(OUTPUT_FORMATS)}]: ").strip()
+
+    if choice in _FORMAT_BY_KEY:
+        output_format, label = _FORMAT_BY_KEY[choice]
+        config.output_format = output_format
+        _autosave(config)
+        print(ok(f"Output format set to: {label}"))
     elif choice == "0":
         print("Cancelled")
     else:
-        print(f"{Colors.YELLOW}⚠️  Invalid choice{Colors.END}")
+        print(warn("Invalid choice"))
 
 
 def set_output_directory(config: TTSConfig):
@@ -289,121 +572,209 @@ def set_output_directory(config: TTSConfig):
 
     if new_dir:
         config.output_dir = new_dir
-        Path(config.output_dir).mkdir(parents=True, exist_ok=True)
-        print(f"{Colors.GREEN}✓ Output directory set to: {config.output_dir}{Colors.END}")
+        _autosave(config)
+        print(ok(f"Output directory set to: {config.output_dir}"))
 
 
 def select_input_file(config: TTSConfig):
     """Select input file or text."""
-    print("\n" + "-"*70)
-    print("INPUT SELECTION")
-    print("-"*70)
+    print(f"\n{_SEP70_DASH}\nINPUT SELECTION\n{_SEP70_DASH}")
 
     if config.conversion_type == "pdf":
         print("Enter path to PDF file:")
         pdf_path = input("> ").strip()
-        if pdf_path and os.path.exists(pdf_path):
+        pdf_stat = _stat_or_none(pdf_path) if pdf_path else None
+        if _is_regular_file(pdf_stat):
             config.pdf_path = pdf_path
-            print(f"{Colors.GREEN}✓ PDF file selected: {pdf_path}{Colors.END}")
-
-            # Ask about page selection
-            pages_input = input("\nEnter page numbers (e.g., '1,3,5-7') or press Enter for all pages: ").strip()
-            if pages_input:
-                config.pdf_pages = parse_page_numbers(pages_input)
-                print(f"{Colors.GREEN}✓ Pages selected: {config.pdf_pages}{Colors.END}")
-            else:
-                config.pdf_pages = None
-                print(f"{Colors.GREEN}✓ All pages will be processed{Colors.END}")
+            config._pdf_stat = pdf_stat
+            print(ok(f"PDF file selected: {pdf_path}"))
+
+            # Ask about page selection; a typo must never fall back to every page
+            while True:
+                pages_input = input("\nEnter page numbers (e.g., '1,3,5-7') or press Enter for all pages: ").strip()
+                if not pages_input:
+                    config.pdf_pages = None
+                    print(ok("All pages will be processed"))
+                    break
+                try:
+                    config.pdf_pages = parse_page_numbers(pages_input)
+                except ValueError as e:
+                    print(warn(f"{e}; please try again"))
+                else:
+                    print(ok(f"Pages selected: {config.pdf_pages.tolist()}"))
+                    break
         else:
-            print(f"{Colors.YELLOW}⚠️  File not found or invalid path{Colors.END}")
+            print(warn("File not found or invalid path"))
 
     elif config.conversion_type == "epub":
         print("Enter path to EPUB file:")
         epub_path = input("> ").strip()
-        if epub_path and os.path.exists(epub_path):
+        epub_stat = _stat_or_none(epub_path) if epub_path else None
+        if _is_regular_file(epub_stat):
             config.epub_path = epub_path
-            print(f"{Colors.GREEN}✓ EPUB file selected: {epub_path}{Colors.END}")
+            config._epub_stat = epub_stat
+            print(ok(f"EPUB file selected: {epub_path}"))
         else:
-            print(f"{Colors.YELLOW}⚠️  File not found or invalid path{Colors.END}")
+            print(warn("File not found or invalid path"))
 
     elif config.conversion_type == "string":
-        print("Enter text to convert to speech:")
-        print("(Type your text and press Enter when done)")
-        text = input("> ").strip()
+        if sys.stdin.isatty():
+            print("Enter or paste text to convert to speech.")
+            print("(Finish with Ctrl-D on an empty line; Ctrl-Z then Enter on Windows)")
+        text = read_text_stdin()
         if text:
-            config.text_input = text
-            print(f"{Colors.GREEN}✓ Text input set ({len(text)} characters){Colors.END}")
+            config.set_text_input(text)
+            print(ok(f"Text input set ({len(text)} characters)"))
         else:
-            print(f"{Colors.YELLOW}⚠️  No text entered{Colors.END}")
+            print(warn("No text entered"))
+
+
+def read_text_stdin() -> str:
+    """Read text from stdin until EOF (multi-line paste or pipe)."""
+    text = sys.stdin.read().strip()
+    if len(text) > LARGE_TEXT_CHARS:
+        print(warn(f"Large input ({len(text)} characters); synthesis may take a long time"))
+    return text
+
+
+def parse_page_numbers(pages_str: str) -> array:
+    """Parse page numbers from string like '1,3,5-7' to array('I', [1,3,5,6,7]).
+
+    Pages are stored as a compact unsigned int array (4 bytes per page).
+    Ranges are merged before expansion, so overlapping selections are never
+    materialized twice and only the ranges (not every page) are sorted.
+    Page numbers below 1 are clamped to 1, and parts that are neither a page
+    number nor a range are skipped.
+
+    Raises:
+        ValueError: If a range is reversed, a page is above _MAX_PAGE, or
+            nothing valid is selected
+    """
+    # Fast path for the common single page ("42") or single range ("1-10")
+    s = pages_str.strip()
+    if s.isdecimal() and 1 <= int(s) <= _MAX_PAGE:
+        return array('I', (int(s),))
+    if ',' not in s and s.count('-') == 1:
+        a, _, b = s.partition('-')
+        a, b = a.strip(), b.strip()
+        if a.isdecimal() and b.isdecimal() and 1 <= int(a) <= int(b) <= _MAX_PAGE:
+            return array('I', range(int(a), int(b) + 1))
+
+    ranges = []
+    for match in _PAGE_RE.finditer(pages_str):
+        start = int(match.group(1))
+        end = int(match.group(2) or match.group(1))
+        if start > end:
+            raise ValueError(f"invalid page range '{start}-{end}': start is after end")
+        if end > _MAX_PAGE:
+            raise ValueError(f"page {end} is beyond the supported maximum of {_MAX_PAGE}")
+        if end < 1:
+            continue
+        ranges.append((max(start, 1), end))
+
+    ranges.sort()
+    pages = array('I')
+    last = 0
+    for start, end in ranges:
+        if end <= last:
+            continue
+        pages.extend(range(max(start, last + 1), end + 1))
+        last = end
+
+    if not pages:
+        raise ValueError(f"no pages selected by '{pages_str}'")
+    return pages
 
 
-def parse_page_numbers(pages_str: str) -> list:
-    """Parse page numbers from string like '1,3,5-7' to [1,3,5,6,7]."""
-    pages = []
-    parts = pages_str.split(',')
+def configure_advanced_settings(config: TTSConfig):
+    """Configure advanced settings."""
+    _emit([_ADVANCED_MENU_TMPL.format_map({
+        "voice": config.voice or "Default",
+        "speed": config.speed,
+        "device": config.device,
+        "batch_size": config.batch_size,
+    })])
 
-    for part in parts:
-        part = part.strip()
-        if '-' in part:
-            start, end = part.split('-')
-            pages.extend(range(int(start), int(end) + 1))
+    choice = input("\nEnter choice [1-4]: ").strip()
+    if choice != "0":
+        _ADV_DISPATCH.get(choice, _invalid_choice)(config)
+
+
+def set_voice(config: TTSConfig):
+    """Set voice/speaker."""
+    print(f"\nCurrent voice: {Colors.CYAN}{config.voice or 'Default'}{Colors.END}")
+    voice = input("Enter voice name (or press Enter for default): ").strip()
+    if voice:
+        config.voice = voice
+        _autosave(config)
+        print(ok(f"Voice set to: {voice}"))
+
+
+def set_speed(config: TTSConfig):
+    """Set speech speed."""
+    print(f"\nCurrent speed: {Colors.CYAN}{config.speed}{Colors.END}")
+    speed_str = input("Enter speed (0.5-2.0, default 1.0): ").strip()
+    if speed_str:
+        if _is_number(speed_str):
+            config.speed = _clamp_speed(float(speed_str))
+            _autosave(config)
+            print(ok(f"Speed set to: {config.speed}"))
         else:
-            pages.append(int(part))
+            print(warn("Invalid speed value"))
 
-    return sorted(set(pages))
 
+def _is_number(value: str) -> bool:
+    """Check for a non-negative decimal like '1' or '1.25' without parsing it."""
+    return value.replace('.', '', 1).isdecimal()
 
-def configure_advanced_settings(config: TTSConfig):
-    """Configure advanced settings."""
-    print("\n" + "-"*70)
-    print("ADVANCED SETTINGS")
-    print("-"*70)
-    print(f"1. Set voice/speaker {Colors.DIM}[{config.voice or 'Default'}]{Colors.END}")
-    print(f"2. Set speech speed {Colors.DIM}[{config.speed}]{Colors.END}")
-    print(f"3. Set device {Colors.DIM}[{config.device}]{Colors.END}")
-    print("0. Back to main menu")
-    print("-"*70)
-
-    choice = input("\nEnter choice [1-3]: ").strip()
-
-    if choice == "1":
-        print(f"\nCurrent voice: {Colors.CYAN}{config.voice or 'Default'}{Colors.END}")
-        voice = input("Enter voice name (or press Enter for default): ").strip()
-        if voice:
-            config.voice = voice
-            print(f"{Colors.GREEN}✓ Voice set to: {voice}{Colors.END}")
-
-    elif choice == "2":
-        print(f"\nCurrent speed: {Colors.CYAN}{config.speed}{Colors.END}")
-        speed_str = input("Enter speed (0.5-2.0, default 1.0): ").strip()
-        if speed_str:
-            try:
-                config.speed = float(speed_str)
-                print(f"{Colors.GREEN}✓ Speed set to: {config.speed}{Colors.END}")
-            except ValueError:
-                print(f"{Colors.YELLOW}⚠️  Invalid speed value{Colors.END}")
 
-    elif choice == "3":
-        print("\n1. Auto (recommended)")
-        print("2. CUDA (GPU)")
-        print("3. CPU")
-        print("4. MPS (Apple Silicon)")
-        device_choice = input("\nEnter choice [1-4]: ").strip()
+def _clamp_speed(speed: float) -> float:
+    """Limit a speech speed to the supported range."""
+    return min(max(speed, MIN_SPEED), MAX_SPEED)
+
 
-        devices = {"1": "auto", "2": "cuda", "3": "cpu", "4": "mps"}
-        if device_choice in devices:
-            config.device = devices[device_choice]
-            print(f"{Colors.GREEN}✓ Device set to: {config.device}{Colors.END}")
+def set_device(config: TTSConfig):
+    """Set compute device."""
+    _emit([""] + [f"{num}. {desc}" for num, _, desc in DEVICES])
+    device_choice = input(f"\nEnter choice [1-{len(DEVICES)}]: ").strip()
+
+    if device_choice in _DEVICE_BY_KEY:
+        config.device = _DEVICE_BY_KEY[device_choice][0]
+        _autosave(config)
+        print(ok(f"Device set to: {config.device}"))
+
+
+def set_batch_size(config: TTSConfig):
+    """Set synthesis batch size."""
+    print(f"\nCurrent batch size: {Colors.CYAN}{config.batch_size}{Colors.END}")
+    print(f"{Colors.DIM}Sentences sent to the model per call (used by models with batched inference, e.g. Qwen3).{Colors.END}")
+    batch_str = input("Enter batch size (1 = one sentence at a time, default 8): ").strip()
+    if batch_str:
+        if batch_str.isdecimal() and int(batch_str) > 0:
+            config.batch_size = int(batch_str)
+            _autosave(config)
+            print(ok(f"Batch size set to: {config.batch_size}"))
+        else:
+            print(warn("Invalid batch size"))
+
+
+# Advanced settings menu: choice -> action(config)
+_ADV_DISPATCH = {
+    "1": set_voice,
+    "2": set_speed,
+    "3": set_device,
+    "4": set_batch_size,
+}
 
 
 def save_configuration(config: TTSConfig):
     """Save current configuration to file."""
     try:
         config_path = config.save_to_file()
-        print(f"\n{Colors.GREEN}✓ Configuration saved to: {config_path}{Colors.END}")
+        print("\n" + ok(f"Configuration saved to: {config_path}"))
         print(f"{Colors.DIM}You can load this configuration later using option 7.{Colors.END}")
     except Exception as e:
-        print(f"\n{Colors.YELLOW}✗ Failed to save configuration: {e}{Colors.END}")
+        print("\n" + fail(f"Failed to save configuration: {e}"))
 
     input("\nPress Enter to continue...")
 
@@ -412,143 +783,332 @@ def load_configuration(config: TTSConfig):
     """Load configuration from file."""
     try:
         if config.load_from_file():
-            print(f"\n{Colors.GREEN}✓ Configuration loaded successfully{Colors.END}")
+            print("\n" + ok("Configuration loaded successfully"))
             view_configuration(config)
         else:
-            print(f"\n{Colors.YELLOW}⚠️  No saved configuration found{Colors.END}")
+            print("\n" + warn("No saved configuration found"))
             print(f"{Colors.DIM}Save a configuration first using option 6.{Colors.END}")
     except Exception as e:
-        print(f"\n{Colors.YELLOW}✗ Failed to load configuration: {e}{Colors.END}")
+        print("\n" + fail(f"Failed to load configuration: {e}"))
 
     input("\nPress Enter to continue...")
 
 
+def _format_file_size(st) -> str:
+    """Format a cached stat result as a size suffix for display."""
+    if st is None:
+        return ""
+    from tts_lib.cleanup import format_bytes
+    return f" {Colors.DIM}({format_bytes(st.st_size)}){Colors.END}"
+
+
 def view_configuration(config: TTSConfig):
     """Display current configuration."""
-    print("\n" + "="*70)
-    print("CURRENT CONFIGURATION")
-    print("="*70)
-    print(f"Conversion Type:  {Colors.BOLD}{config.conversion_type.upper()}{Colors.END}")
-    print(f"TTS Model:        {Colors.BOLD}{get_model_display_name(config.tts_model)}{Colors.END}")
-    print(f"PDF Extractor:    {Colors.BOLD}{get_extractor_display_name(config.pdf_extractor)}{Colors.END}")
-    print(f"Output Format:    {Colors.BOLD}{config.output_format.upper()}{Colors.END}")
-    print(f"Output Directory: {config.output_dir}")
-    print(f"Device:           {config.device}")
-    print(f"Voice:            {config.voice or 'Default'}")
-    print(f"Speed:            {config.speed}")
-
     if config.conversion_type == "pdf":
-        print(f"PDF Path:         {config.pdf_path or 'Not set'}")
-        print(f"Pages:            {config.pdf_pages or 'All pages'}")
+        input_lines = (
+            f"PDF Path:         {config.pdf_path or 'Not set'}{_format_file_size(config._pdf_stat)}\n"
+            f"Pages:            {config.pdf_pages.tolist() if config.pdf_pages else 'All pages'}\n"
+        )
     elif config.conversion_type == "epub":
-        print(f"EPUB Path:        {config.epub_path or 'Not set'}")
+        input_lines = f"EPUB Path:        {config.epub_path or 'Not set'}{_format_file_size(config._epub_stat)}\n"
     elif config.conversion_type == "string":
-        text_preview = config.text_input[:50] + "..." if config.text_input and len(config.text_input) > 50 else config.text_input
-        print(f"Text:             {text_preview or 'Not set'}")
-
-    print("="*70)
-
-
-def validate_configuration(config: TTSConfig) -> Tuple[bool, str]:
+        input_lines = f"Text:             {config._text_preview or 'Not set'}\n"
+    else:
+        input_lines = ""
+
+    _emit([_VIEW_CONFIG_TMPL.format_map({
+        "conversion_type": config.conversion_type.upper(),
+        "model": get_model_display_name(config.tts_model),
+        "extractor": get_extractor_display_name(config.pdf_extractor),
+        "output_format": config.output_format.upper(),
+        "output_dir": config.output_dir,
+        "device": config.device,
+        "voice": config.voice or "Default",
+        "speed": config.speed,
+        "batch_size": config.batch_size,
+        "input_lines": input_lines,
+    })])
+
+
+def validate_configuration(config: TTSConfig) -> "tuple[bool, str]":
     """Validate configuration before running conversion."""
-    if config.conversion_type == "pdf":
-        if not config.pdf_path:
+    conversion_type = config.conversion_type
+    if conversion_type == "pdf":
+        pdf_path = config.pdf_path
+        if not pdf_path:
             return False, "No PDF file selected"
-        if not os.path.exists(config.pdf_path):
-            return False, f"PDF file not found: {config.pdf_path}"
+        if not _is_regular_file(config._pdf_stat):
+            return False, f"PDF file not found: {pdf_path}"
         if not config.pdf_extractor:
             return False, "No PDF extractor selected"
 
-    elif config.conversion_type == "epub":
-        if not config.epub_path:
+    elif conversion_type == "epub":
+        epub_path = config.epub_path
+        if not epub_path:
             return False, "No EPUB file selected"
-        if not os.path.exists(config.epub_path):
-            return False, f"EPUB file not found: {config.epub_path}"
+        if not _is_regular_file(config._epub_stat):
+            return False, f"EPUB file not found: {epub_path}"
 
-    elif config.conversion_type == "string":
+    elif conversion_type == "string":
         if not config.text_input:
             return False, "No text input provided"
 
     return True, "Configuration valid"
 
 
+# First transformers release compatible with newer PyTorch pytree internals
+MIN_TRANSFORMERS = "4.41.0"
+
+
+def _transformers_is_compatible() -> bool:
+    """Check the installed transformers version without running pip."""
+    try:
+        from importlib.metadata import version
+        from packaging.version import Version
+        return Version(version("transformers")) >= Version(MIN_TRANSFORMERS)
+    except (ImportError, ValueError):
+        # Not installed, packaging missing, or an unparsable version
+        return False
+
+
 def fix_transformers_compatibility():
     """Fix PyTorch/transformers compatibility issue."""
+    if _transformers_is_compatible():
+        # Already upgraded (e.g. by an earlier fix); only a restart is needed
+        print("\n" + ok(f"transformers>={MIN_TRANSFORMERS} is already installed"))
+        return True
+
     try:
         import subprocess
         import sys
 
-        print(f"\n{Colors.YELLOW}⚠️  Fixing PyTorch/transformers compatibility...{Colors.END}")
+        print("\n" + warn("Fixing PyTorch/transformers compatibility..."))
         print(f"{Colors.DIM}   This is a known issue with newer PyTorch versions.{Colors.END}")
 
         # Upgrade transformers to a compatible version
         subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "-q", "--upgrade", "transformers>=4.41.0"],
+            [sys.executable, "-m", "pip", "install", "-q", "--upgrade", f"transformers>={MIN_TRANSFORMERS}"],
             stderr=subprocess.DEVNULL
         )
-        print(f"{Colors.GREEN}✓ Compatibility fix applied{Colors.END}")
+        print(ok("Compatibility fix applied"))
         return True
     except Exception as e:
-        print(f"{Colors.YELLOW}⚠️  Could not apply fix automatically: {e}{Colors.END}")
+        print(warn(f"Could not apply fix automatically: {e}"))
         print(f"{Colors.DIM}   Try: pip install --upgrade transformers{Colors.END}")
         return False
 
 
-def run_conversion(config: TTSConfig):
-    """Run the TTS conversion."""
-    # Validate configuration
+def _deps_cache_key(config: TTSConfig) -> str:
+    """Get cache key for the dependency set required by a configuration.
+
+    The stamp directory is shared by every interpreter, so the key includes the
+    environment prefix and the version of the installer's package lists.
+    """
+    from tts_lib.setup import DEPENDENCY_SET_VERSION
+
+    key = (sys.prefix, DEPENDENCY_SET_VERSION, config.tts_model, config.pdf_extractor,
+           config.conversion_type, config.output_format)
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+def _deps_stamp_path(config: TTSConfig) -> str:
+    """Get path of the stamp file marking dependencies as installed."""
+    return os.path.join(STATE_DIR, f"{_deps_cache_key(config)}.ok")
+
+
+def _mark_deps_installed(stamp_path: str):
+    """Write the dependency stamp file atomically."""
+    os.makedirs(os.path.dirname(stamp_path), exist_ok=True)
+    tmp_path = stamp_path + ".tmp"
+    open(tmp_path, 'w').close()
+    os.replace(tmp_path, stamp_path)
+
+
+def _ensure_output_dir(config: TTSConfig):
+    """Create the output directory once per distinct path."""
+    if config._output_dir_created != config.output_dir:
+        os.makedirs(config.output_dir, exist_ok=True)
+        config._output_dir_created = config.output_dir
+
+
+def _output_cache_key(config: TTSConfig) -> str:
+    """Get output cache key for the input and every setting affecting the audio."""
+    from tts_lib.output_cache import hash_file, make_key
+
+    if config.conversion_type == "pdf":
+        source = (os.path.basename(config.pdf_path), hash_file(config.pdf_path),
+                  config.pdf_pages, config.pdf_extractor)
+    elif config.conversion_type == "epub":
+        source = (os.path.basename(config.epub_path), hash_file(config.epub_path))
+    else:
+        source = (config.text_input,)
+    return make_key(config.conversion_type, source, config.tts_model,
+                    config.voice, config.speed, config.output_format)
+
+
+def _result_from_paths(config: TTSConfig, paths: list):
+    """Rebuild the run_conversion result shape from restored output files."""
+    if config.conversion_type == "epub":
+        return paths[0]
+    manifests = [p for p in paths if p.endswith("_manifest.json")]
+    audio = [p for p in paths if not p.endswith("_manifest.json")]
+    return audio[0], manifests[0]
+
+
+def _result_paths(config: TTSConfig, result) -> list:
+    """List the output files of a run_conversion result."""
+    if config.conversion_type == "epub":
+        return [result]
+    return list(result)
+
+
+def ensure_dependencies(config: TTSConfig):
+    """Install dependencies unless already installed for this configuration."""
+    # The installer only needs the standard library
+    from tts_lib.setup import install_dependencies
+
+    stamp_path = _deps_stamp_path(config)
+    if stamp_path in _DEPS_VERIFIED or os.path.exists(stamp_path):
+        _DEPS_VERIFIED.add(stamp_path)
+        print(f"\n{Symbols.PACKAGE} Dependencies already installed {Colors.DIM}(cached){Colors.END}")
+        return
+
+    print(f"\n{Symbols.PACKAGE} Installing dependencies...")
+    install_dependencies(
+        tts_model=config.tts_model,
+        pdf_extractor=config.pdf_extractor,
+        conversion_type=config.conversion_type,
+        out_format=config.output_format
+    )
+    _mark_deps_installed(stamp_path)
+    _DEPS_VERIFIED.add(stamp_path)
+
+
+def _lazy_load_tts():
+    """Import the torch-backed conversion entry points.
+
+    These modules import torch and the model packages at import time, so this
+    must only run after ensure_dependencies().
+
+    Returns:
+        Tuple of (initialize_system, run_conversion)
+    """
+    from tts_lib.init_system import initialize_system
+    from tts_lib.examples import run_conversion
+    return initialize_system, run_conversion
+
+
+def _release_systems():
+    """Drop cached TTS backends and free the memory their models held."""
+    _INIT_CACHE.clear()
+
+    import gc
+    gc.collect()
+    if "torch" in sys.modules:
+        torch = sys.modules["torch"]
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+
+def get_system(config: TTSConfig):
+    """Get the initialized (tts, config_lib, pdf_extractor) for a configuration.
+
+    The TTS model depends only on the model and device, so it is reused across
+    conversion types and output directories; the cheap config and PDF extractor
+    are rebuilt on every call. Only one model is kept, so switching models
+    releases the previous one first.
+    """
+    initialize_system, _ = _lazy_load_tts()
+
+    backend_key = (config.tts_model, config.device)
+    tts = _INIT_CACHE.get(backend_key)
+    if tts is not None:
+        print(f"\n{Symbols.ROCKET} Reusing loaded TTS model {Colors.DIM}(cached){Colors.END}")
+    else:
+        if _INIT_CACHE:
+            _release_systems()
+        print(f"\n{Symbols.ROCKET} Initializing TTS system...")
+
+    system = initialize_system(
+        tts_model=config.tts_model,
+        output_dir=config.output_dir,
+        device=config.device,
+        pdf_extractor_name=config.pdf_extractor if config.conversion_type == "pdf" else None,
+        conversion_type=config.conversion_type,
+        tts=tts
+    )
+    _INIT_CACHE[backend_key] = system[0]
+    return system
+
+
+def run_conversion(config: TTSConfig, interactive: bool = True) -> bool:
+    """Run the TTS conversion.
+
+    Args:
+        config: CLI configuration
+        interactive: Pause for Enter after finishing (menu mode)
+
+    Returns:
+        True if the conversion completed successfully
+    """
+    # Validate configuration against the input file as it is now
+    config.refresh_input_stat()
     valid, message = validate_configuration(config)
     if not valid:
-        print(f"\n{Colors.YELLOW}⚠️  Configuration Error: {message}{Colors.END}")
+        print("\n" + warn(f"Configuration Error: {message}"))
         print("Please configure all required settings before running conversion.")
-        input("\nPress Enter to continue...")
-        return
+        if interactive:
+            input("\nPress Enter to continue...")
+        return False
+
+    try:
+        _ensure_output_dir(config)
+    except OSError as e:
+        print("\n" + warn(f"Cannot create output directory: {e}"))
+        if interactive:
+            input("\nPress Enter to continue...")
+        return False
 
-    print("\n" + "="*70)
-    print("RUNNING CONVERSION")
-    print("="*70)
+    print(f"\n{_SEP70_EQ}\nRUNNING CONVERSION\n{_SEP70_EQ}")
+
+    cache_key = None
+    if config.use_cache:
+        from tts_lib import output_cache
+        try:
+            cache_key = _output_cache_key(config)
+            cached = output_cache.lookup(cache_key, config.output_dir, OUTPUT_CACHE_DIR)
+        except OSError:
+            cached = None
+        if cached:
+            print(f"\n{Symbols.MIC} Reusing previous conversion {Colors.DIM}(cached){Colors.END}")
+            _print_conversion_result(config, _result_from_paths(config, cached))
+            if interactive:
+                input("\nPress Enter to continue...")
+            return True
 
     try:
-        # Import required modules
-        from tts_lib.config import TTSConfig as TTSConfigLib
-        from tts_lib.init_system import initialize_system
-        from tts_lib.examples import run_conversion
-        from tts_lib.setup import install_dependencies
-
-        # Install dependencies
-        print("\n📦 Installing dependencies...")
         try:
-            install_dependencies(
-                tts_model=config.tts_model,
-                pdf_extractor=config.pdf_extractor,
-                conversion_type=config.conversion_type,
-                out_format=config.output_format
-            )
+            ensure_dependencies(config)
         except AttributeError as e:
             if "PyTreeSpec" in str(e):
                 # Handle transformers compatibility issue
-                print(f"\n{Colors.YELLOW}⚠️  PyTorch/transformers compatibility issue detected{Colors.END}")
+                print("\n" + warn("PyTorch/transformers compatibility issue detected"))
                 if fix_transformers_compatibility():
-                    print(f"{Colors.GREEN}✓ Please restart the CLI to apply the fix{Colors.END}")
-                    input("\nPress Enter to exit...")
+                    print(ok("Please restart the CLI to apply the fix"))
+                    if interactive:
+                        input("\nPress Enter to exit...")
                     sys.exit(0)
                 else:
                     raise
             else:
                 raise
 
-        # Initialize system
-        print("\n🚀 Initializing TTS system...")
-        tts, config_lib, pdf_extractor = initialize_system(
-            tts_model=config.tts_model,
-            output_dir=config.output_dir,
-            device=config.device,
-            pdf_extractor_name=config.pdf_extractor if config.conversion_type == "pdf" else None,
-            conversion_type=config.conversion_type
-        )
+        tts, config_lib, pdf_extractor = get_system(config)
+
+        _, run_conversion = _lazy_load_tts()
 
         # Run conversion
-        print("\n🎤 Starting conversion...")
+        print(f"\n{Symbols.MIC} Starting conversion...")
         result = run_conversion(
             conversion_type=config.conversion_type,
             tts=tts,
@@ -559,31 +1119,83 @@ def run_conversion(config: TTSConfig):
             pdf_path=config.pdf_path or "files/doc.pdf",
             pdf_pages=config.pdf_pages,
             epub_path=config.epub_path or "book.epub",
-            zip_name=""
+            zip_name="",
+            text=config.text_input,
+            voice=config.voice,
+            speed=config.speed,
+            batch_size=config.batch_size
         )
 
-        print("\n" + "="*70)
-        print(f"{Colors.GREEN}✓ CONVERSION COMPLETED SUCCESSFULLY{Colors.END}")
-        print("="*70)
-
-        if config.conversion_type in ["pdf", "string"]:
-            audio_path, manifest_path = result
-            print(f"Audio file:    {Colors.CYAN}{audio_path}{Colors.END}")
-            print(f"Manifest file: {Colors.CYAN}{manifest_path}{Colors.END}")
-        else:  # epub
-            print(f"ZIP archive: {Colors.CYAN}{result}{Colors.END}")
+        # The tts_lib entry points report missing inputs by returning None
+        if result is None or None in _result_paths(config, result):
+            print("\n" + fail("Conversion produced no output"))
+            success = False
+        else:
+            if cache_key:
+                try:
+                    output_cache.store(cache_key, _result_paths(config, result), OUTPUT_CACHE_DIR)
+                except OSError as e:
+                    print(f"{Colors.DIM}Could not cache conversion output: {e}{Colors.END}")
 
-        print(f"\n💡 You can now upload these files to the web player at:")
-        print(f"   {Colors.BLUE}https://svm0n.github.io/ttsweb/{Colors.END}")
+            _print_conversion_result(config, result)
+            success = True
 
     except KeyboardInterrupt:
-        print(f"\n\n{Colors.YELLOW}⚠️  Conversion cancelled by user{Colors.END}")
+        print("\n\n" + warn("Conversion cancelled by user"))
+        success = False
     except Exception as e:
-        print(f"\n{Colors.YELLOW}✗ Error during conversion: {e}{Colors.END}")
+        print("\n" + fail(f"Error during conversion: {e}"))
         import traceback
         traceback.print_exc()
+        success = False
+
+    if interactive:
+        input("\nPress Enter to continue...")
+    return success
+
+
+def _print_conversion_result(config: TTSConfig, result):
+    """Print the output files of a finished conversion."""
+    print(f"\n{_SEP70_EQ}\n{ok('CONVERSION COMPLETED SUCCESSFULLY')}\n{_SEP70_EQ}")
+
+    if config.conversion_type in ["pdf", "string"]:
+        audio_path, manifest_path = result
+        print(f"Audio file:    {Colors.CYAN}{audio_path}{Colors.END}")
+        print(f"Manifest file: {Colors.CYAN}{manifest_path}{Colors.END}")
+    else:  # epub
+        print(f"ZIP archive: {Colors.CYAN}{result}{Colors.END}")
+
+    print(f"\n{Symbols.TIP} You can now upload these files to the web player at:")
+    print(f"   {Colors.BLUE}https://svm0n.github.io/ttsweb/{Colors.END}")
+
+
+def unload_models():
+    """Release cached TTS models and free their memory."""
+    if not _INIT_CACHE:
+        print(f"\n{Colors.DIM}No TTS model loaded.{Colors.END}")
+        return
+
+    count = len(_INIT_CACHE)
+    _release_systems()
+    print("\n" + ok(f"Unloaded {count} cached TTS model(s)"))
 
-    input("\nPress Enter to continue...")
+
+def reset_configuration(config: TTSConfig):
+    """Reset settings to defaults and persist them."""
+    config.reset()
+    _autosave(config)
+    print(ok("Settings reset to defaults"))
+
+
+# Configuration menu: choice -> action(config)
+_CONFIG_DISPATCH = {
+    "1": select_conversion_type,
+    "2": select_tts_model,
+    "3": select_pdf_extractor,
+    "4": select_output_format,
+    "5": set_output_directory,
+    "6": reset_configuration,
+}
 
 
 def configuration_menu(config: TTSConfig):
@@ -591,21 +1203,9 @@ def configuration_menu(config: TTSConfig):
     while True:
         print_config_menu(config)
         choice = input("\nEnter choice: ").strip()
-
-        if choice == "1":
-            select_conversion_type(config)
-        elif choice == "2":
-            select_tts_model(config)
-        elif choice == "3":
-            select_pdf_extractor(config)
-        elif choice == "4":
-            select_output_format(config)
-        elif choice == "5":
-            set_output_directory(config)
-        elif choice == "0":
+        if choice == "0":
             break
-        else:
-            print(f"{Colors.YELLOW}⚠️  Invalid choice. Please try again.{Colors.END}")
+        _CONFIG_DISPATCH.get(choice, _invalid_choice)(config)
 
 
 def storage_management():
@@ -619,12 +1219,11 @@ def storage_management():
         "detectron2": "Detectron2",
         "kokoro": "Kokoro Models",
         "pip": "Pip Cache",
+        "tts_output": "Conversion Output Cache",
     }
 
     while True:
-        print("\n" + "="*70)
-        print("STORAGE MANAGEMENT")
-        print("="*70)
+        print(f"\n{_SEP70_EQ}\nSTORAGE MANAGEMENT\n{_SEP70_EQ}")
 
         print("\nScanning caches...")
         cache_info = list_cache_sizes()
@@ -636,19 +1235,21 @@ def storage_management():
             exists, size, path = cache_info[cache_name]
             if exists:
                 size_str = format_bytes(size)
-                print(f"  [{i}] {Colors.GREEN}✓{Colors.END} {display_name:28s} {Colors.BOLD}{size_str:>10s}{Colors.END}  {Colors.DIM}({path}){Colors.END}")
+                print(f"  [{i}] {Colors.GREEN}{Symbols.OK}{Colors.END} {display_name:28s} {Colors.BOLD}{size_str:>10s}{Colors.END}  {Colors.DIM}({path}){Colors.END}")
                 total_size += size
             else:
-                print(f"  [{i}] {Colors.DIM}✗ {display_name:28s} {'not found':>10s}{Colors.END}")
+                print(f"  [{i}] {Colors.DIM}{Symbols.FAIL} {display_name:28s} {'not found':>10s}{Colors.END}")
             entries.append(cache_name)
 
-        print()
-        print(f"  {'TOTAL':32s} {Colors.BOLD}{format_bytes(total_size):>10s}{Colors.END}")
-        print()
-        print("-"*70)
-        print("  [a] Delete ALL caches")
-        print("  [0] Back to main menu")
-        print("-"*70)
+        _emit([
+            "",
+            f"  {'TOTAL':32s} {Colors.BOLD}{format_bytes(total_size):>10s}{Colors.END}",
+            "",
+            _SEP70_DASH,
+            "  [a] Delete ALL caches",
+            "  [0] Back to main menu",
+            _SEP70_DASH,
+        ])
 
         choice = input("\nEnter number to delete a cache, [a] for all, or [0] to go back: ").strip().lower()
 
@@ -663,7 +1264,7 @@ def storage_management():
                     if exists:
                         delete_cache(cache_name)
                         freed += size
-                print(f"\n{Colors.GREEN}✓ All caches deleted. Freed {format_bytes(freed)}.{Colors.END}")
+                print("\n" + ok(f"All caches deleted. Freed {format_bytes(freed)}."))
             else:
                 print("Cancelled.")
         elif choice.isdigit() and 1 <= int(choice) <= len(entries):
@@ -684,13 +1285,351 @@ def storage_management():
     input("\nPress Enter to continue...")
 
 
-def main():
-    """Main CLI loop."""
+def set_input_path(config: TTSConfig, path: str):
+    """Select a PDF or EPUB input file, setting the conversion type from its extension.
+
+    Raises:
+        ValueError: If the file is neither a PDF nor an EPUB
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".pdf":
+        config.conversion_type = "pdf"
+        config.set_pdf_path(path)
+    elif extension == ".epub":
+        config.conversion_type = "epub"
+        config.set_epub_path(path)
+    else:
+        raise ValueError(f"unsupported input file (expected .pdf or .epub): {path}")
+
+
+def _default_workers(config: TTSConfig) -> int:
+    """Default number of batch worker processes.
+
+    Each worker loads its own copy of the model, so GPU (and auto-detected)
+    devices use a single worker; CPU runs use half the cores.
+    """
+    if config.device == "cpu":
+        return max(1, (os.cpu_count() or 2) // 2)
+    return 1
+
+
+def _convert_path(config: TTSConfig, path: str) -> bool:
+    """Convert one batch input file with a copy of the configuration."""
+    job_config = copy.copy(config)
+    set_input_path(job_config, path)
+    return run_conversion(job_config, interactive=False)
+
+
+# Batch worker state (one configuration per worker process)
+_WORKER_CONFIG = None
+
+
+def _worker_init(config: TTSConfig):
+    """Load the TTS model once per worker process."""
+    global _WORKER_CONFIG
+    _WORKER_CONFIG = config
+    try:
+        get_system(config)
+    except Exception as e:
+        # Reported again by the conversions that need the model
+        print(warn(f"Worker could not preload the TTS model: {e}"))
+
+
+def _convert_one(path: str) -> bool:
+    """Convert one batch input file in a worker process."""
+    return _convert_path(_WORKER_CONFIG, path)
+
+
+def run_batch(config: TTSConfig, paths, workers=None) -> bool:
+    """Convert several PDF/EPUB files, in parallel worker processes if workers > 1.
+
+    Returns:
+        True if every file was converted successfully
+    """
+    jobs = []
+    failed = []
+    job_types = set()
+    # Outputs are named after the input's stem in the shared output directory
+    output_names = {}
+    for path in paths:
+        job_config = copy.copy(config)
+        try:
+            set_input_path(job_config, path)
+        except ValueError as e:
+            print(warn(f"Skipping: {e}"))
+            failed.append(path)
+            continue
+        output_name = (job_config.conversion_type, os.path.splitext(os.path.basename(path))[0])
+        if output_name in output_names:
+            print(warn(f"Skipping: {path} would overwrite the output of {output_names[output_name]}"))
+            failed.append(path)
+            continue
+        output_names[output_name] = path
+        jobs.append(path)
+        job_types.add(job_config.conversion_type)
+
+    if not jobs:
+        print(fail("No valid input files to convert"))
+        return False
+    # Group jobs by conversion type, keeping the given order within each type
+    jobs.sort(key=lambda path: os.path.splitext(path)[1].lower())
+
+    # Install dependencies once up front so workers never run pip concurrently
+    for conversion_type in sorted(job_types):
+        deps_config = copy.copy(config)
+        deps_config.conversion_type = conversion_type
+        try:
+            ensure_dependencies(deps_config)
+        except Exception as e:
+            print("\n" + fail(f"Dependency installation failed: {e}"))
+            return False
+
+    workers = max(1, min(workers or _default_workers(config), len(jobs)))
+    print(f"\n{_SEP70_EQ}\nBATCH CONVERSION: {len(jobs)} file(s), {workers} worker(s)\n{_SEP70_EQ}")
+
+    if workers == 1:
+        results = [_convert_path(config, path) for path in jobs]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Preload the model for the first job's conversion type
+        worker_config = copy.copy(config)
+        set_input_path(worker_config, jobs[0])
+        # Forked workers would otherwise repeat output still in the buffer
+        sys.stdout.flush()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_worker_init,
+                                 initargs=(worker_config,)) as executor:
+            results = list(executor.map(_convert_one, jobs))
+
+    failed.extend(path for path, succeeded in zip(jobs, results) if not succeeded)
+
+    print(f"\n{_SEP70_EQ}\nBATCH SUMMARY: {sum(results)}/{len(paths)} converted\n{_SEP70_EQ}")
+    for path in failed:
+        print(fail(path))
+    return not failed
+
+
+def _page_spec(value: str) -> array:
+    """argparse type for --pages that reports parse errors verbatim."""
+    try:
+        return parse_page_numbers(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def _speed(value: str) -> float:
+    """argparse type for --speed, clamped to the supported range."""
+    if not _is_number(value):
+        raise argparse.ArgumentTypeError(f"expected a number, got '{value}'")
+    return _clamp_speed(float(value))
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for strictly positive integers."""
+    if not value.isdecimal() or int(value) < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got '{value}'")
+    return int(value)
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser for non-interactive use."""
+    parser = argparse.ArgumentParser(
+        prog="tts_cli",
+        description="Convert PDFs, EPUBs, and text to speech. "
+                    "Without an input option, starts the interactive menu.",
+        add_help=True,
+    )
+
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--pdf", metavar="PATH", help="PDF file to convert")
+    source.add_argument("--epub", metavar="PATH", help="EPUB file to convert (per-chapter ZIP)")
+    source.add_argument("--text", metavar="TEXT",
+                        help="text string to convert ('-' reads from stdin)")
+    source.add_argument("--batch", nargs="+", metavar="PATH",
+                        help="convert several PDF/EPUB files (type chosen by extension)")
+
+    parser.add_argument("--model", dest="tts_model",
+                        choices=[model for _, model, _ in TTS_MODELS],
+                        help="TTS model")
+    parser.add_argument("--extractor", dest="pdf_extractor",
+                        choices=[extractor for _, extractor, _ in PDF_EXTRACTORS],
+                        help="PDF extractor")
+    parser.add_argument("--pages", type=_page_spec, metavar="SPEC",
+                        help="PDF pages to convert, e.g. '1,3,5-7' (default: all)")
+    parser.add_argument("--out-format", dest="output_format", choices=[fmt for _, fmt, _ in OUTPUT_FORMATS],
+                        help="output audio format")
+    parser.add_argument("--output-dir", metavar="DIR", help="output directory")
+    parser.add_argument("--device", choices=[device for _, device, _ in DEVICES],
+                        help="compute device")
+    parser.add_argument("--voice", help="voice/speaker name or description")
+    parser.add_argument("--speed", type=_speed, help=f"speech speed ({MIN_SPEED}-{MAX_SPEED})")
+    parser.add_argument("--batch-size", type=_positive_int, metavar="N",
+                        help="sentences per model call for models with batched inference")
+    parser.add_argument("--workers", type=_positive_int, metavar="N",
+                        help="worker processes for --batch (default: 1 on GPU/auto, "
+                             "half the CPU cores with --device cpu); each loads its own model")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false",
+                        help="always synthesize, ignoring and not updating the output cache")
+    parser.add_argument("--no-color", action="store_true",
+                        help="disable colored output (also set by the NO_COLOR environment variable)")
+    parser.add_argument("--interactive", action="store_true",
+                        help="start the interactive menu (default when no input is given)")
+    return parser
+
+
+def apply_args(config: TTSConfig, args: argparse.Namespace):
+    """Apply command-line arguments on top of a configuration (for this session only)."""
+    for attr in ("tts_model", "pdf_extractor", "output_format", "output_dir",
+                 "device", "voice", "speed", "batch_size"):
+        value = getattr(args, attr)
+        if value is not None:
+            config.set_override(attr, value)
+    config.use_cache = args.use_cache
+
+    if args.pdf:
+        config.set_override("conversion_type", "pdf")
+        config.set_pdf_path(args.pdf)
+        config.pdf_pages = args.pages
+    elif args.epub:
+        config.set_override("conversion_type", "epub")
+        config.set_epub_path(args.epub)
+    elif args.text:
+        config.set_override("conversion_type", "string")
+        config.set_text_input(read_text_stdin() if args.text == "-" else args.text)
+
+
+def _buffer_stdout():
+    """Give stdout a larger write buffer when it is redirected.
+
+    Terminals stay line buffered so conversion progress shows up as it
+    happens; input() flushes before each prompt either way.
+    """
+    try:
+        if sys.stdout.isatty():
+            return
+        fd = sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return
+    sys.stdout.flush()
+    raw = io.FileIO(fd, "w", closefd=False)
+    sys.stdout = io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=STDOUT_BUFFER_SIZE),
+                                  encoding=sys.stdout.encoding, errors=sys.stdout.errors)
+
+
+def _disable_colors():
+    """Turn off ANSI colors everywhere (--no-color or NO_COLOR)."""
+    global _OK, _WARN, _FAIL, _END, _MAIN_MENU
+    global _CONFIG_MENU_TMPL, _ADVANCED_MENU_TMPL, _VIEW_CONFIG_TMPL
+    for name in [name for name in vars(Colors) if not name.startswith("_")]:
+        setattr(Colors, name, "")
+    _OK, _WARN, _FAIL, _END = f"{Symbols.OK} ", f"{Symbols.WARN}  ", f"{Symbols.FAIL} ", ""
+    _MAIN_MENU = _ANSI_RE.sub("", _MAIN_MENU)
+    _CONFIG_MENU_TMPL = _ANSI_RE.sub("", _CONFIG_MENU_TMPL)
+    _ADVANCED_MENU_TMPL = _ANSI_RE.sub("", _ADVANCED_MENU_TMPL)
+    _VIEW_CONFIG_TMPL = _ANSI_RE.sub("", _VIEW_CONFIG_TMPL)
+    _bold_current.cache_clear()
+
+
+def main(argv=None) -> int:
+    """CLI entry point.
+
+    Runs a single conversion when an input is given on the command line,
+    otherwise starts the interactive menu.
+    """
+    if not _UTF and hasattr(sys.stdout, "reconfigure"):
+        # Library output may still contain non-ASCII text; never die on it
+        sys.stdout.reconfigure(errors="replace")
+    _buffer_stdout()
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+    if args.pages and not (args.pdf or args.batch):
+        parser.error("--pages requires --pdf or --batch")
+    if args.workers and not args.batch:
+        parser.error("--workers requires --batch")
+    if args.no_color or os.environ.get("NO_COLOR"):
+        _disable_colors()
+
     config = TTSConfig()
 
     # Try to load saved configuration
     config.load_from_file()
+    apply_args(config, args)
+
+    if args.interactive or not (args.pdf or args.epub or args.text or args.batch):
+        interactive_session(config)
+        return 0
+
+    if args.batch:
+        config.pdf_pages = args.pages
+        return 0 if run_batch(config, args.batch, args.workers) else 1
+
+    return 0 if run_conversion(config, interactive=False) else 1
+
+
+_completion_matches = []
+
+
+def _path_completer(text, state):
+    """Complete file system paths for readline."""
+    if state == 0:
+        _completion_matches[:] = [
+            path + os.sep if os.path.isdir(path) else path
+            for path in sorted(glob.glob(os.path.expanduser(text) + "*"))
+        ]
+    return _completion_matches[state] if state < len(_completion_matches) else None
+
 
+def _setup_readline():
+    """Enable line editing, persistent history and path completion for prompts."""
+    try:
+        import readline
+    except ImportError:
+        # Not available on Windows without pyreadline
+        return
+    import atexit
+
+    history_path = os.path.join(STATE_DIR, "history")
+    try:
+        readline.read_history_file(history_path)
+    except OSError:
+        pass
+    readline.set_history_length(1000)
+
+    def save_history():
+        try:
+            os.makedirs(STATE_DIR, exist_ok=True)
+            readline.write_history_file(history_path)
+        except OSError:
+            pass
+
+    atexit.register(save_history)
+
+    readline.set_completer_delims(" \t\n")
+    if "libedit" in (readline.__doc__ or ""):
+        # macOS system Python ships libedit instead of GNU readline
+        readline.parse_and_bind("bind ^I rl_complete")
+    else:
+        readline.parse_and_bind("tab: complete")
+    readline.set_completer(_path_completer)
+
+
+# Main menu: choice -> action(config)
+_MAIN_DISPATCH = {
+    "1": configuration_menu,
+    "2": select_input_file,
+    "3": run_conversion,
+    "4": view_configuration,
+    "5": configure_advanced_settings,
+    "6": save_configuration,
+    "7": load_configuration,
+    "8": lambda _config: storage_management(),
+    "9": lambda _config: unload_models(),
+}
+
+
+def interactive_session(config: TTSConfig):
+    """Main interactive CLI loop."""
+    _setup_readline()
     print_banner()
     print("Welcome! This tool converts PDFs, EPUBs, and text to speech.")
     print("Start by configuring your conversion settings (Option 1).")
@@ -698,39 +1637,21 @@ def main():
     while True:
         print_menu(config)
         choice = input("\nEnter choice: ").strip()
-
-        if choice == "1":
-            configuration_menu(config)
-        elif choice == "2":
-            select_input_file(config)
-        elif choice == "3":
-            run_conversion(config)
-        elif choice == "4":
-            view_configuration(config)
-        elif choice == "5":
-            configure_advanced_settings(config)
-        elif choice == "6":
-            save_configuration(config)
-        elif choice == "7":
-            load_configuration(config)
-        elif choice == "8":
-            storage_management()
-        elif choice == "0":
-            print(f"\n{Colors.CYAN}👋 Thank you for using TTS CLI!{Colors.END}")
+        if choice == "0":
+            print(f"\n{Colors.CYAN}{Symbols.WAVE} Thank you for using TTS CLI!{Colors.END}")
             print(f"Visit {Colors.BLUE}https://svm0n.github.io/ttsweb/{Colors.END} to use the web player.\n")
             sys.exit(0)
-        else:
-            print(f"{Colors.YELLOW}⚠️  Invalid choice. Please try again.{Colors.END}")
+        _MAIN_DISPATCH.get(choice, _invalid_choice)(config)
 
 
 if __name__ == "__main__":
     try:
-        main()
+        sys.exit(main())
     except KeyboardInterrupt:
-        print(f"\n\n{Colors.CYAN}👋 Exiting TTS CLI. Goodbye!{Colors.END}\n")
+        print(f"\n\n{Colors.CYAN}{Symbols.WAVE} Exiting TTS CLI. Goodbye!{Colors.END}\n")
         sys.exit(0)
     except Exception as e:
-        print(f"\n{Colors.YELLOW}✗ Fatal error: {e}{Colors.END}")
+        print("\n" + fail(f"Fatal error: {e}"))
         import traceback
         traceback.print_exc()
         sys.exit(1)
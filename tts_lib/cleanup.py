@@ -128,6 +128,7 @@ def delete_cache(cache_name):
             - "detectron2": Detectron2 cache
             - "kokoro": Kokoro model cache
             - "pip": Pip package cache
+            - "tts_output": Cached conversion outputs of the TTS CLI
 
     Returns:
         True if deletion was successful, False otherwise
@@ -141,6 +142,7 @@ def delete_cache(cache_name):
         "detectron2": home / ".torch" / "fvcore_cache" / "detectron2",
         "kokoro": home / ".cache" / "kokoro",
         "pip": home / ".cache" / "pip",
+        "tts_output": home / ".ttscli" / "cache",
     }
 
     if cache_name not in cache_paths:
@@ -184,6 +186,7 @@ def list_cache_sizes():
         "detectron2": home / ".torch" / "fvcore_cache" / "detectron2",
         "kokoro": home / ".cache" / "kokoro",
         "pip": home / ".cache" / "pip",
+        "tts_output": home / ".ttscli" / "cache",
     }
 
     cache_info = {}
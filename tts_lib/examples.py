@@ -14,7 +14,8 @@ from pathlib import Path
 def run_conversion(conversion_type, tts, config, pdf_extractor, tts_model,
                    out_format="wav",
                    pdf_path="files/Case1Writeup.pdf", pdf_pages=None,
-                   epub_path="book.epub", zip_name=""):
+                   epub_path="book.epub", zip_name="",
+                   text=None, voice=None, speed=1.0, batch_size=1):
     """
     Universal conversion function that routes to the appropriate conversion type.
 
@@ -29,6 +30,10 @@ def run_conversion(conversion_type, tts, config, pdf_extractor, tts_model,
         pdf_pages: List of page numbers or None for all pages (for PDF conversion)
         epub_path: Path to EPUB file (for EPUB conversion)
         zip_name: Custom ZIP name (for EPUB conversion)
+        text: Text to synthesize (for string conversion, None for sample text)
+        voice: Voice/speaker to use (None for default)
+        speed: Speech speed (Kokoro and Maya1 only)
+        batch_size: Sentences per synthesis call (backends with batched inference)
 
     Returns:
         Tuple of (audio_path, manifest_path) for string/pdf, or zip_path for epub
@@ -51,7 +56,11 @@ def run_conversion(conversion_type, tts, config, pdf_extractor, tts_model,
             config=config,
             tts_model=tts_model,
             out_format=out_format,
-            in_colab=in_colab
+            in_colab=in_colab,
+            text=text,
+            voice=voice,
+            speed=speed,
+            batch_size=batch_size
         )
 
     elif conversion_type == "pdf":
@@ -63,7 +72,10 @@ def run_conversion(conversion_type, tts, config, pdf_extractor, tts_model,
             out_format=out_format,
             pdf_path=pdf_path,
             pages=pdf_pages,
-            in_colab=in_colab
+            in_colab=in_colab,
+            voice=voice,
+            speed=speed,
+            batch_size=batch_size
         )
 
     elif conversion_type == "epub":
@@ -74,7 +86,10 @@ def run_conversion(conversion_type, tts, config, pdf_extractor, tts_model,
             out_format=out_format,
             epub_path=epub_path,
             zip_name=zip_name,
-            in_colab=in_colab
+            in_colab=in_colab,
+            voice=voice,
+            speed=speed,
+            batch_size=batch_size
         )
 
     else:
@@ -83,17 +98,18 @@ def run_conversion(conversion_type, tts, config, pdf_extractor, tts_model,
         return None
 
 
-def run_string_to_audio(tts, config, tts_model, out_format="wav", in_colab=False):
+def run_string_to_audio(tts, config, tts_model, out_format="wav", in_colab=False,
+                        text=None, voice=None, speed=1.0, batch_size=1):
     """Convert text string to audio."""
     from tts_lib.synthesis import synth_string
 
     # Configuration
-    VOICE = None  # Use default voice (or specify a voice description)
-    SPEED = 1.0   # Speech speed (Kokoro and Maya1 only)
+    VOICE = voice  # None = default voice (or specify a voice description)
+    SPEED = speed  # Speech speed (Kokoro and Maya1 only)
 
     # Text to synthesize
     # For Maya1: You can add emotion tags like <laugh>, <whisper>, <cry>, etc.
-    TEXT = """Hello! This is a test of the unified TTS system.
+    TEXT = text or """Hello! This is a test of the unified TTS system.
     It automatically installs only the dependencies you need.
     """
 
@@ -105,7 +121,8 @@ def run_string_to_audio(tts, config, tts_model, out_format="wav", in_colab=False
         voice=VOICE,
         speed=SPEED,
         out_format=out_format,
-        tts_model=tts_model
+        tts_model=tts_model,
+        batch_size=batch_size
     )
 
     print(f"\n✓ Audio saved to: {audio_path}")
@@ -121,13 +138,14 @@ def run_string_to_audio(tts, config, tts_model, out_format="wav", in_colab=False
 
 
 def run_pdf_to_audio(tts, config, pdf_extractor, tts_model, out_format="wav",
-                     pdf_path="files/Case1Writeup.pdf", pages=None, in_colab=False):
+                     pdf_path="files/Case1Writeup.pdf", pages=None, in_colab=False,
+                     voice=None, speed=1.0, batch_size=1):
     """Convert PDF to audio with optional page selection."""
     from tts_lib.synthesis import synth_pdf
 
     # Configuration
-    VOICE = None  # Use default voice
-    SPEED = 1.0
+    VOICE = voice  # None = default voice
+    SPEED = speed
 
     # Check if file exists, provide helpful message if not
     if not os.path.exists(pdf_path):
@@ -152,7 +170,8 @@ def run_pdf_to_audio(tts, config, pdf_extractor, tts_model, out_format="wav",
         speed=SPEED,
         out_format=out_format,
         pages=pages,
-        tts_model=tts_model
+        tts_model=tts_model,
+        batch_size=batch_size
     )
 
     print(f"\n✓ Audio saved to: {audio_path}")
@@ -168,13 +187,14 @@ def run_pdf_to_audio(tts, config, pdf_extractor, tts_model, out_format="wav",
 
 
 def run_epub_to_audio(tts, config, tts_model, out_format="wav",
-                      epub_path="book.epub", zip_name="", in_colab=False):
+                      epub_path="book.epub", zip_name="", in_colab=False,
+                      voice=None, speed=1.0, batch_size=1):
     """Convert EPUB to per-chapter audio ZIP."""
     from tts_lib.synthesis import synth_epub
 
     # Configuration
-    VOICE = None  # Use default voice
-    SPEED = 1.0
+    VOICE = voice  # None = default voice
+    SPEED = speed
 
     # Check if file exists, provide helpful message if not
     if not os.path.exists(epub_path):
@@ -197,7 +217,8 @@ def run_epub_to_audio(tts, config, tts_model, out_format="wav",
         speed=SPEED,
         per_chapter_format=out_format,
         zip_name=(zip_name or None),
-        tts_model=tts_model
+        tts_model=tts_model,
+        batch_size=batch_size
     )
 
     print(f"\n✓ ZIP archive saved to: {zip_path}")
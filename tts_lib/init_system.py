@@ -43,7 +43,8 @@ def initialize_system(
     output_dir,
     device,
     pdf_extractor_name=None,
-    conversion_type="string"
+    conversion_type="string",
+    tts=None
 ):
     """Initialize the TTS system.
 
@@ -53,6 +54,7 @@ def initialize_system(
         device: Device to use ("auto", "cuda", "cpu", "mps")
         pdf_extractor_name: PDF extractor name (or None)
         conversion_type: Type of conversion ("string", "pdf", "epub")
+        tts: Already loaded backend for tts_model and device to reuse (or None)
 
     Returns:
         Tuple of (tts_backend, config, pdf_extractor)
@@ -65,12 +67,15 @@ def initialize_system(
     print(f"\n{config}")
 
     # Load TTS backend
-    print(f"\n📥 Loading TTS backend: {tts_model}...")
-    tts = create_backend(tts_model, device=config.device)
-    print(f"✓ TTS backend loaded: {tts.get_name()}")
-    print(f"  Available voices: {tts.get_available_voices()[:5]}...")  # Show first 5
-    print(f"  Default voice: {tts.get_default_voice()}")
-    print(f"  Sample rate: {tts.get_sample_rate()} Hz")
+    if tts is None:
+        print(f"\n📥 Loading TTS backend: {tts_model}...")
+        tts = create_backend(tts_model, device=config.device)
+        print(f"✓ TTS backend loaded: {tts.get_name()}")
+        print(f"  Available voices: {tts.get_available_voices()[:5]}...")  # Show first 5
+        print(f"  Default voice: {tts.get_default_voice()}")
+        print(f"  Sample rate: {tts.get_sample_rate()} Hz")
+    else:
+        print(f"\n✓ Reusing loaded TTS backend: {tts.get_name()}")
 
     # Load PDF extractor if needed
     pdf_extractor = None
@@ -8,6 +8,11 @@ import json
 from pathlib import Path
 from typing import List, Dict, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def create_manifest(audio_filename: str, timeline: List[Dict]) -> Dict:
     """Create a manifest dictionary.
@@ -25,6 +30,26 @@ def create_manifest(audio_filename: str, timeline: List[Dict]) -> Dict:
     }
 
 
+def manifest_to_bytes(manifest: Dict) -> bytes:
+    """Serialize a manifest to UTF-8 JSON bytes.
+
+    Uses orjson when installed (much faster for long timelines) and falls back
+    to the standard library for unavailable or unsupported values.
+
+    Args:
+        manifest: Manifest dictionary
+
+    Returns:
+        Indented JSON as bytes
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(manifest, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def save_manifest(manifest: Dict, output_path: str) -> None:
     """Save a manifest to a JSON file.
 
@@ -32,8 +57,7 @@ def save_manifest(manifest: Dict, output_path: str) -> None:
         manifest: Manifest dictionary
         output_path: Path to save the manifest file
     """
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    Path(output_path).write_bytes(manifest_to_bytes(manifest))
 
 
 def load_manifest(manifest_path: str) -> Dict:
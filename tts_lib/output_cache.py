@@ -0,0 +1,140 @@
+"""Persistent cache of finished conversions.
+
+Each entry is a directory named after a key that describes the conversion
+(the input content plus every setting that changes the audio) and holds
+copies of the files it produced. Repeating a conversion then only costs a
+file copy instead of a full synthesis.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+DEFAULT_MAX_BYTES = 5 * 1024 ** 3
+
+
+def hash_file(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """Hash a file's content.
+
+    Args:
+        path: File to hash
+        chunk_size: Read size in bytes
+
+    Returns:
+        Hex digest of the file content
+    """
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def make_key(*parts) -> str:
+    """Build a cache key from the repr of the given parts."""
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def lookup(key: str, dest_dir: Union[str, Path], cache_dir: Union[str, Path]) -> Optional[List[str]]:
+    """Restore a cached conversion into an output directory.
+
+    Files are copied rather than hard-linked, since synthesis later overwrites
+    output files in place and would otherwise corrupt the cache entry.
+
+    Args:
+        key: Cache key
+        dest_dir: Directory to copy the cached files into
+        cache_dir: Cache root directory
+
+    Returns:
+        Paths of the restored files, or None on a cache miss
+    """
+    entry = Path(cache_dir) / key
+    try:
+        names = sorted(os.listdir(entry))
+    except OSError:
+        return None
+    if not names:
+        return None
+
+    dest_dir = Path(dest_dir)
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    restored = []
+    for name in names:
+        target = dest_dir / name
+        tmp_path = target.with_name(target.name + ".tmp")
+        shutil.copyfile(entry / name, tmp_path)
+        os.replace(tmp_path, target)
+        restored.append(str(target))
+
+    # Mark as recently used for LRU eviction (mtime, since atime is unreliable)
+    os.utime(entry)
+    return restored
+
+
+def store(key: str, paths: Iterable[Union[str, Path]], cache_dir: Union[str, Path],
+          max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+    """Copy the output files of a conversion into the cache.
+
+    The entry is assembled in a temporary directory and renamed into place,
+    so concurrent conversions never see a partial entry.
+
+    Args:
+        key: Cache key
+        paths: Output files of the conversion
+        cache_dir: Cache root directory
+        max_bytes: Size cap enforced with evict() after storing
+    """
+    cache_dir = Path(cache_dir)
+    entry = cache_dir / key
+    tmp_entry = cache_dir / f".{key}.{os.getpid()}.tmp"
+    try:
+        tmp_entry.mkdir(parents=True)
+        for path in paths:
+            shutil.copyfile(path, tmp_entry / Path(path).name)
+        try:
+            os.replace(tmp_entry, entry)
+        except OSError:
+            pass  # Another process stored the same conversion first
+    finally:
+        shutil.rmtree(tmp_entry, ignore_errors=True)
+
+    evict(cache_dir, max_bytes)
+
+
+def evict(cache_dir: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES) -> int:
+    """Delete least recently used entries until the cache fits in max_bytes.
+
+    Recency is the entry directory's mtime, which lookup() refreshes on a hit.
+
+    Args:
+        cache_dir: Cache root directory
+        max_bytes: Maximum total size of the cache
+
+    Returns:
+        Number of bytes freed
+    """
+    entries = []
+    total = 0
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.startswith(".") or not entry.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(entry.path) as files:
+                    size = sum(f.stat().st_size for f in files if f.is_file())
+                entries.append((entry.stat().st_mtime, size, entry.path))
+                total += size
+    except OSError:
+        return 0
+
+    freed = 0
+    entries.sort()
+    for _, size, path in entries:
+        if total - freed <= max_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        freed += size
+    return freed
@@ -8,6 +8,10 @@ PDF extractor, and output formats.
 import subprocess
 import sys
 
+# Bump whenever the package lists below change, so installs recorded for an
+# older dependency set are redone
+DEPENDENCY_SET_VERSION = 2
+
 
 def install_package(package):
     """Install a package using pip."""
@@ -63,7 +67,7 @@ def install_dependencies(
             install_package("torch")
 
     # Install other core packages
-    core_packages = ["soundfile", "numpy", "ebooklib", "pydub"]
+    core_packages = ["soundfile", "numpy", "ebooklib", "pydub", "orjson"]
     for pkg in core_packages:
         try:
             __import__(pkg.replace("-", "_"))
@@ -9,13 +9,12 @@ All functions handle model-specific parameters automatically.
 """
 
 import io
-import json
 import zipfile
 from pathlib import Path
 from typing import Union, Optional, List, Tuple
 
 from .tts_utils import wav_to_mp3_bytes, safe_name, extract_chapters_from_epub
-from .manifest import create_manifest, save_manifest
+from .manifest import create_manifest, save_manifest, manifest_to_bytes
 
 
 def _synthesize_with_backend(tts, elements, tts_model, voice, speed=1.0, **kwargs):
@@ -27,7 +26,8 @@ def _synthesize_with_backend(tts, elements, tts_model, voice, speed=1.0, **kwarg
         tts_model: TTS model name
         voice: Voice/speaker to use
         speed: Speech speed (for Kokoro only)
-        **kwargs: Additional model-specific parameters
+        **kwargs: Additional parameters passed to synthesize_text_to_wav
+            (e.g. batch_size) and on to the model
 
     Returns:
         Tuple of (wav_bytes, timeline)
@@ -264,7 +264,7 @@ def synth_epub(
 
             # Add manifest to ZIP
             manifest = create_manifest(audio_name, timeline)
-            zf.writestr(f"{name}_manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2))
+            zf.writestr(f"{name}_manifest.json", manifest_to_bytes(manifest))
 
     # Save ZIP with model name
     zip_buf.seek(0)
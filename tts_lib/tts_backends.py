@@ -79,15 +79,32 @@ class TTSBackend(ABC):
         """
         pass
 
+    def synthesize_batch(self, texts: List[str], **kwargs) -> List[np.ndarray]:
+        """Synthesize several sentences.
+
+        The default implementation synthesizes one sentence at a time.
+        Backends with batched inference override this to use a single model call.
+
+        Args:
+            texts: Sentences to synthesize
+            **kwargs: Model-specific parameters (voice, speaker, speed, etc.)
+
+        Returns:
+            List of audio arrays (float32), one per sentence
+        """
+        return [self.synthesize_sentence(text, **kwargs) for text in texts]
+
     def synthesize_text_to_wav(
         self,
         text_or_elements: Union[str, List[Dict]],
+        batch_size: int = 1,
         **kwargs
     ) -> Tuple[bytes, List[Dict]]:
         """Synthesize text to WAV with timeline information.
 
         Args:
             text_or_elements: Either a string or list of text elements with metadata
+            batch_size: Number of sentences passed to synthesize_batch at once
             **kwargs: Model-specific parameters
 
         Returns:
@@ -111,25 +128,23 @@ class TTSBackend(ABC):
         t = 0.0
         sentence_index = 0
 
-        # Count total sentences for progress tracking
-        total_sentences = sum(
-            len([s for s in split_sentences_keep_delim(element.get("text", "")) if s])
+        # Flatten elements into (sentence, metadata) pairs
+        sentences = [
+            (sent, element.get("metadata", {}))
             for element in elements
-        )
+            for sent in split_sentences_keep_delim(element.get("text", ""))
+            if sent
+        ]
+        total_sentences = len(sentences)
+        batch_size = max(1, batch_size)
 
         print(f"Synthesizing {len(elements)} text elements ({total_sentences} sentences total)...")
 
-        for element in elements:
-            element_text = element.get("text", "")
-            element_meta = element.get("metadata", {})
-
-            sentences = split_sentences_keep_delim(element_text)
-
-            for sent in sentences:
-                if not sent:
-                    continue
+        for batch_start in range(0, total_sentences, batch_size):
+            batch = sentences[batch_start:batch_start + batch_size]
+            pcms = self.synthesize_batch([sent for sent, _ in batch], **kwargs)
 
-                pcm = self.synthesize_sentence(sent, **kwargs)
+            for (sent, element_meta), pcm in zip(batch, pcms):
                 dur = pcm.shape[0] / sr
 
                 timeline.append({
@@ -174,6 +189,7 @@ class KokoroBackend(TTSBackend):
         super().__init__(device)
         self.version = version
         self._pipeline_cache = {}
+        self._model = None
 
         print(f"Initializing Kokoro {version} backend on {self.device}...")
 
@@ -188,7 +204,18 @@ class KokoroBackend(TTSBackend):
             Kokoro pipeline instance
         """
         from kokoro import KPipeline
-        return KPipeline(lang_code=lang_code, device=self.device)
+        return KPipeline(lang_code=lang_code, device=self.device, model=self._get_model())
+
+    def _get_model(self):
+        """Load the Kokoro weights once and share them across language pipelines.
+
+        KPipeline otherwise builds its own KModel, re-reading the checkpoint
+        for every language code used.
+        """
+        if self._model is None:
+            from kokoro import KModel
+            self._model = KModel(repo_id="hexgrad/Kokoro-82M").to(self.device).eval()
+        return self._model
 
     def synthesize_sentence(
         self,
@@ -715,6 +742,52 @@ class Qwen3TTSBackend(TTSBackend):
             print(f"Error synthesizing sentence: {e}")
             return np.zeros((self.get_sample_rate() // 10,), dtype=np.float32)
 
+    def synthesize_batch(
+        self,
+        texts: List[str],
+        voice: str = "Vivian",
+        language: str = "English",
+        instruct: Optional[str] = None,
+        ref_audio: Optional[str] = None,
+        ref_text: Optional[str] = None,
+        **kwargs
+    ) -> List[np.ndarray]:
+        """Synthesize several sentences in one Qwen3-TTS generate call.
+
+        Voice cloning and single sentences use the per-sentence path;
+        a failed batch call falls back to it as well.
+        """
+        if self.model is None or len(texts) == 1 or (ref_audio and ref_text):
+            return super().synthesize_batch(
+                texts, voice=voice, language=language, instruct=instruct,
+                ref_audio=ref_audio, ref_text=ref_text, **kwargs
+            )
+
+        n = len(texts)
+        try:
+            if self.model_variant == "voice_design":
+                wavs, sr = self.model.generate_voice_design(
+                    text=list(texts),
+                    language=[language] * n,
+                    instruct=[voice] * n,
+                )
+            else:
+                wavs, sr = self.model.generate_custom_voice(
+                    text=list(texts),
+                    language=[language] * n,
+                    speaker=[voice] * n,
+                    instruct=[instruct or ""] * n,
+                )
+            if len(wavs) != n:
+                # Results are paired with sentences positionally; never drop any
+                raise ValueError(f"expected {n} waveforms, got {len(wavs)}")
+            return [wav.astype(np.float32) for wav in wavs]
+
+        except Exception as e:
+            print(f"Batched synthesis failed ({e}), falling back to per-sentence synthesis")
+            return super().synthesize_batch(texts, voice=voice, language=language,
+                                            instruct=instruct, **kwargs)
+
     def get_sample_rate(self) -> int:
         return 12000  # Qwen3-TTS uses 12kHz
 